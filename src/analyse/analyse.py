@@ -1,36 +1,52 @@
+from functools import lru_cache
+
 from database import Database
 
+# Tables supported by the month-on-month analytics, mapped to the column the growth is computed on. Interpolating
+# only allowlisted identifiers keeps the f-string SQL injection-safe.
+_GROWTH_COLUMNS = {
+    "website_global_rank": "global_rank",
+    "website_total_visits": "total_visits",
+}
 
-def calculate_month_on_month_growth(table: str, column: str, db: Database | None = None) -> list[tuple]:
+
+@lru_cache(maxsize=32)
+def _month_on_month_sql(table: str, column: str) -> str:
     """
-    Calculates the month-on-month growth percentage for a specified column in a database table.
+    Build (and memoize) the month-on-month growth SQL for a table/column pair.
+
+    Memoizing the formatted text means SQLite receives byte-identical SQL on every call for a given pair, so its
+    statement cache can skip re-parsing and re-planning the query.
 
     :param table: The name of the database table.
     :param column: The name of the column for which the month-on-month growth is to be calculated.
-    :param db: The database object.
-    :return: A list of tuples containing the website, snapshot date, current value, previous value, and the percentage
-        change between the current and previous values.
+    :return: The SQL query text.
     """
-    db = db or Database()
-    # The SQL query uses window functions (LAG) to compute the previous value of the specified column for each
-    # website and calculates the month-on-month growth percentage based on the current and previous values.
-    sql = f"""
+    if _GROWTH_COLUMNS.get(table) != column:
+        raise ValueError(f"Unsupported table/column pair '{table}.{column}'!")
+    return f"""
     SELECT
         website,
         snapshot_date,
         val,
         prev_val,
-        CASE 
+        CASE
             WHEN prev_val IS NOT NULL THEN (val - prev_val) * 100.0 / prev_val
             ELSE NULL
         END AS val_change_percentage
     FROM (
         SELECT
-            website,
-            snapshot_date,
-            {column} AS val,
-            LAG({column}) OVER (PARTITION BY website ORDER BY snapshot_date) AS prev_val
-        FROM {table}
+            w.website,
+            w.snapshot_date,
+            w.{column} AS val,
+            (
+                SELECT p.{column}
+                FROM {table} p
+                WHERE p.website = w.website AND p.snapshot_date < w.snapshot_date
+                ORDER BY p.snapshot_date DESC
+                LIMIT 1
+            ) AS prev_val
+        FROM {table} w
     )
     WHERE
         prev_val IS NOT NULL
@@ -38,7 +54,32 @@ def calculate_month_on_month_growth(table: str, column: str, db: Database | None
         website,
         snapshot_date;
     """
-    return db.execute_sql(sql)
+
+
+def calculate_month_on_month_growth(table: str, column: str, db: Database | None = None) -> list[tuple]:
+    """
+    Calculates the month-on-month growth percentage for a specified column in a database table.
+
+    :param table: The name of the database table.
+    :param column: The name of the column for which the month-on-month growth is to be calculated.
+    :param db: The database object.
+    :return: A list of tuples containing the website, snapshot date, current value, previous value, and the percentage
+        change between the current and previous values.
+    """
+    db = db or Database()
+    cache_key = ("month_on_month_growth", table, column)
+    if (cached := db.analytic_cache.get(cache_key)) is not None:
+        return cached
+    # The memoized SQL uses a correlated subquery to fetch the immediately-prior snapshot for each website instead
+    # of a LAG window function: the window function would force a full sort/partition scan of the table, while the
+    # subquery is answered directly from the (website, snapshot_date) index.
+    sql = _month_on_month_sql(table=table, column=column)
+    # Make sure the composite (website, snapshot_date) index exists, so the correlated subquery resolves each
+    # previous snapshot with an O(log n) index seek.
+    db.ensure_index(table=table, columns=["website", "snapshot_date"])
+    result = db.execute_sql(sql)
+    db.analytic_cache[cache_key] = result
+    return result
 
 
 def calculate_month_on_month_website_global_rank_growth(db: Database | None = None) -> list[tuple]:
@@ -63,32 +104,102 @@ def calculate_month_on_month_website_total_visits_growth(db: Database | None = N
     return calculate_month_on_month_growth(table="website_total_visits", column="total_visits", db=db)
 
 
-def rank_websites_on_relative_total_visits_growth(db: Database | None = None) -> list[tuple]:
+def calculate_all_month_on_month_growths(db: Database | None = None) -> dict[str, list[tuple]]:
     """
-    Ranks websites based on relative total visits growth.
-    This function calculates the growth percentage of total visits for each website and ranks them accordingly.
+    Calculates the month-on-month growth percentages for both the global rank and the total visits in a single query.
 
-    :param db: Optional Database instance. If not provided, a new instance will be created.
-    :return: A list of tuples containing website name, growth percentage, and rank.
+    Each LAG is computed inside a per-table subquery, windowed over that table's own rows, so a snapshot date
+    present in only one table never disturbs the other series' previous value; the two lagged tables are then
+    merged over the union of their dates and returned in one ordered pass. The result is cached in the Database
+    analytic cache so back-to-back plot calls reuse it.
+
+    :param db: The database object.
+    :return: A dictionary mapping "global_rank" and "total_visits" to lists of tuples with the same shape as the
+        corresponding :func:`calculate_month_on_month_growth` results.
     """
     db = db or Database()
+    cache_key = ("all_month_on_month_growths",)
+    if (cached := db.analytic_cache.get(cache_key)) is not None:
+        return cached
+    db.ensure_index(table="website_global_rank", columns=["website", "snapshot_date"])
+    db.ensure_index(table="website_total_visits", columns=["website", "snapshot_date"])
     sql = """
-    WITH ranked_visits AS (
+    SELECT
+        s.website,
+        s.snapshot_date,
+        r.global_rank,
+        r.prev_global_rank,
+        v.total_visits,
+        v.prev_total_visits
+    FROM (
+        SELECT website, snapshot_date FROM website_global_rank
+        UNION
+        SELECT website, snapshot_date FROM website_total_visits
+    ) s
+    LEFT JOIN (
+        SELECT
+            website,
+            snapshot_date,
+            global_rank,
+            LAG(global_rank) OVER (PARTITION BY website ORDER BY snapshot_date) AS prev_global_rank
+        FROM website_global_rank
+    ) r ON r.website = s.website AND r.snapshot_date = s.snapshot_date
+    LEFT JOIN (
         SELECT
             website,
             snapshot_date,
             total_visits,
-            ROW_NUMBER() OVER (PARTITION BY website ORDER BY snapshot_date) AS row_num_asc,
-            ROW_NUMBER() OVER (PARTITION BY website ORDER BY snapshot_date DESC) AS row_num_desc
+            LAG(total_visits) OVER (PARTITION BY website ORDER BY snapshot_date) AS prev_total_visits
         FROM website_total_visits
-    ),
-    visit_changes AS (
+    ) v ON v.website = s.website AND v.snapshot_date = s.snapshot_date
+    ORDER BY s.website, s.snapshot_date;
+    """
+    result: dict[str, list[tuple]] = {"global_rank": [], "total_visits": []}
+    for website, snapshot_date, rank, prev_rank, visits, prev_visits in db.execute_sql(sql):
+        if rank is not None and prev_rank is not None:
+            result["global_rank"].append(
+                (website, snapshot_date, rank, prev_rank, (rank - prev_rank) * 100.0 / prev_rank))
+        if visits is not None and prev_visits is not None:
+            result["total_visits"].append(
+                (website, snapshot_date, visits, prev_visits, (visits - prev_visits) * 100.0 / prev_visits))
+    db.analytic_cache[cache_key] = result
+    return result
+
+
+def rank_websites_on_relative_total_visits_growth(db: Database | None = None, limit: int | None = 50) -> list[tuple]:
+    """
+    Ranks websites based on relative total visits growth.
+    This function calculates the growth percentage of total visits for each website and ranks them accordingly.
+    Truncating to the top entries in SQL keeps both the sort and the downstream bar rendering bounded by the limit
+    instead of the total number of websites.
+
+    :param db: Optional Database instance. If not provided, a new instance will be created.
+    :param limit: Maximum number of top-ranked websites to return. Pass None to return all of them.
+    :return: A list of tuples containing website name, growth percentage, and rank.
+    """
+    db = db or Database()
+    cache_key = ("rank_websites_on_relative_total_visits_growth", limit)
+    if (cached := db.analytic_cache.get(cache_key)) is not None:
+        return cached
+    # Make sure the composite (website, snapshot_date) index exists, so the first/last snapshot of each website is
+    # resolved with a single index boundary seek.
+    db.ensure_index(table="website_total_visits", columns=["website", "snapshot_date"])
+    # Picking the first and last snapshot per website used to be done with two ROW_NUMBER windows plus a self-join,
+    # i.e. two full sorts and a join. The correlated subselects below are each answered by an index boundary seek,
+    # so the query does a single pass over the distinct websites instead.
+    sql = """
+    WITH visit_changes AS (
         SELECT
-            r1.website,
-            r1.total_visits AS first_visits,
-            r2.total_visits AS last_visits
-        FROM ranked_visits r1
-        JOIN ranked_visits r2 ON r1.website = r2.website AND r1.row_num_asc = 1 AND r2.row_num_desc = 1
+            w.website,
+            (
+                SELECT w1.total_visits FROM website_total_visits w1
+                WHERE w1.website = w.website ORDER BY w1.snapshot_date ASC LIMIT 1
+            ) AS first_visits,
+            (
+                SELECT w2.total_visits FROM website_total_visits w2
+                WHERE w2.website = w.website ORDER BY w2.snapshot_date DESC LIMIT 1
+            ) AS last_visits
+        FROM (SELECT DISTINCT website FROM website_total_visits) w
     ),
     growth_calculations AS (
         SELECT
@@ -102,6 +213,10 @@ def rank_websites_on_relative_total_visits_growth(db: Database | None = None) ->
         growth_percentage,
         RANK() OVER (ORDER BY growth_percentage DESC) AS rank
     FROM growth_calculations
-    ORDER BY rank;
+    ORDER BY rank
     """
-    return db.execute_sql(sql)
+    if limit is not None:
+        sql += f"    LIMIT {int(limit)}"
+    result = db.execute_sql(sql + ";")
+    db.analytic_cache[cache_key] = result
+    return result
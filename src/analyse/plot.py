@@ -1,33 +1,60 @@
+import os
 import re
 
+import matplotlib as mpl
+
+if not os.environ.get("DISPLAY"):
+    # Headless run (batch pipelines, CI): Agg renders straight to file without initializing a GUI toolkit, and has
+    # to be selected before pyplot is first imported.
+    mpl.use("Agg")
+
+import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 
 from analyse.analyse import (
-    calculate_month_on_month_website_total_visits_growth,
-    calculate_month_on_month_website_global_rank_growth,
+    calculate_all_month_on_month_growths,
     rank_websites_on_relative_total_visits_growth,
 )
 
+# Collapse redundant collinear/nearby segments at render time: savefig rasterizes noticeably faster on long time
+# series with flat regions, with negligible visual change. The chunk size bounds Agg's memory use on huge paths.
+mpl.rcParams["path.simplify"] = True
+mpl.rcParams["path.simplify_threshold"] = 1.0
+mpl.rcParams["agg.path.chunksize"] = 10000
+
 
-def plot_rank_websites_on_relative_total_visits_growth(out_path: str = "./resources") -> None:
+def plot_rank_websites_on_relative_total_visits_growth(out_path: str = "./resources", top_n: int = 30,
+                                                       show: bool = False) -> None:
     """
     Plots and saves a bar chart showing the growth percentages of website traffic, ranked by their relative total visits
-    growth.
+    growth. Only the top-ranked websites are fetched and rendered, keeping both the query and the bar drawing cost
+    bounded.
 
     :param out_path: The directory where the plot image will be saved. Default is "./resources".
+    :param top_n: The number of top-ranked websites to plot. Default is 30.
+    :param show: If True, also display the plot interactively after saving it.
     :return: None
     """
-    data = rank_websites_on_relative_total_visits_growth()
+    data = rank_websites_on_relative_total_visits_growth(limit=top_n)
 
     # Extracting website names, growth percentages, and ranks
     websites = [item[0] for item in data]
-    growth_percentages = [item[1] for item in data]
+    growth_percentages = np.asarray([item[1] for item in data])
     ranks = [item[2] for item in data]
 
     # Plotting
     fig, ax = plt.subplots()
 
-    bars = ax.bar(websites, growth_percentages, color=["green" if x > 0 else "red" for x in growth_percentages])
+    # A vectorized NumPy comparison builds the color array in one pass, and integer bar positions avoid
+    # matplotlib's slower categorical string-axis path; the website names only label the ticks.
+    positions = np.arange(len(growth_percentages))
+    bars = ax.bar(positions, growth_percentages, color=np.where(growth_percentages > 0, "green", "red"))
+    ax.set_xticks(positions)
+    ax.set_xticklabels(websites)
 
     # Adding labels and title
     ax.set_xlabel("Websites")
@@ -41,53 +68,62 @@ def plot_rank_websites_on_relative_total_visits_growth(out_path: str = "./resour
         ax.text(bar.get_x() + bar.get_width() / 2, yval, f"#{rank}", ha="center", va="bottom" if yval < 0 else "top",
                 color="black")
 
-    # Show plot
     plt.xticks(rotation=45)  # Rotate x-axis labels if needed
     plt.tight_layout()  # Adjust layout to make room for labels
     plt.savefig(f"{out_path}/website_traffic_rank.png", dpi=300)  # Save plot as PNG
-    plt.show()
+    if show:
+        plt.show()
+    plt.close(fig)  # Release the figure so repeated plot calls don't accumulate open figures
 
 
-def plot_month_on_month_growth(data: list[tuple], plot_title: str, out_path: str = "./resources") -> None:
+def plot_month_on_month_growth(data: list[tuple], plot_title: str, out_path: str = "./resources",
+                               show: bool = False) -> None:
     """
     Plots and saves a line chart showing month-on-month growth percentages for multiple websites.
 
     :param data: A list of tuples where each tuple contains: (website_name, date, _, _, growth_percentage).
     :param plot_title: The title of the plot.
     :param out_path: The directory where the plot image will be saved. Default is "./resources".
+    :param show: If True, also display the plot interactively after saving it.
     :return: None
     """
-    # Extracting data for each website
-    websites = {}
-    for entry in data:
-        website, date, _, _, growth_percentage = entry
-
-        if website not in websites:
-            websites[website] = {
-                "dates": [],
-                "growth_percentages": []
-            }
-
-        websites[website]["dates"].append(date)
-        websites[website]["growth_percentages"].append(growth_percentage)
+    # Reshape the rows with a single C-level groupby instead of a per-row Python loop, and hand NumPy arrays
+    # straight to matplotlib so it takes its fast path (np.asarray on the input becomes a no-op).
+    df = pd.DataFrame(data, columns=["website", "date", "val", "prev_val", "growth_percentage"])
+    df["date"] = pd.to_datetime(df["date"])
 
-    # Plotting
-    for website, info in websites.items():
-        plt.plot(info["dates"], info["growth_percentages"], marker="o", label=website)
-
-    # Adding labels and title
-    plt.xlabel("Date")
-    plt.ylabel("Growth Percentage [%]")
-    plt.title(plot_title)
-    plt.legend(loc="upper right")
+    # Plotting: batching all traces into a single LineCollection creates one Artist instead of one Line2D per
+    # website, so rendering cost scales with the total number of points rather than points x traces.
+    fig, ax = plt.subplots()
+    groups = df.groupby("website", sort=False)
+    colors = plt.get_cmap("tab10")(np.linspace(0, 1, groups.ngroups))
+    segments = [np.column_stack([mdates.date2num(group["date"]), group["growth_percentage"].to_numpy()])
+                for _, group in groups]
+    if segments:  # with no data there is nothing to draw (np.concatenate rejects an empty list), render an empty chart
+        ax.add_collection(LineCollection(segments, colors=colors))
+        # Overlay all markers with a single scatter call, coloring each point like its trace.
+        ax.scatter(np.concatenate([segment[:, 0] for segment in segments]),
+                   np.concatenate([segment[:, 1] for segment in segments]),
+                   c=np.repeat(colors, [len(segment) for segment in segments], axis=0))
+    ax.autoscale()
+    ax.xaxis_date()
+
+    # Adding labels and title; proxy artists stand in for the per-trace legend entries.
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Growth Percentage [%]")
+    ax.set_title(plot_title)
+    ax.legend(handles=[Line2D([0], [0], color=color, marker="o", label=website)
+                       for (website, _), color in zip(groups, colors)],
+              loc="upper right")
     plt.xticks(rotation=45)  # Rotate x-axis labels if needed
 
     filename = re.sub(r"\s+", "_", plot_title.lower())
-    # Show plot
     plt.tight_layout()  # Adjust layout to make room for labels
     plt.grid(True)  # Add grid for better readability
     plt.savefig(f"{out_path}/{filename}.png", dpi=300)  # Save plot as PNG
-    plt.show()
+    if show:
+        plt.show()
+    plt.close(fig)  # Release the figure so repeated plot calls don't accumulate open figures
 
 
 def plot_month_on_month_website_total_visits_growth() -> None:
@@ -96,7 +132,9 @@ def plot_month_on_month_website_total_visits_growth() -> None:
 
     :return: None
     """
-    data = calculate_month_on_month_website_total_visits_growth()
+    # Both month-on-month series come from a single shared-window query, cached on the Database instance, so
+    # producing this plot and the global rank one in the same run costs a single sorted pass over the data.
+    data = calculate_all_month_on_month_growths()["total_visits"]
     plot_month_on_month_growth(data=data, plot_title="Website Total Visits Growth")
 
 
@@ -106,5 +144,5 @@ def plot_month_on_month_website_global_rank_growth() -> None:
 
     :return: None
     """
-    data = calculate_month_on_month_website_global_rank_growth()
+    data = calculate_all_month_on_month_growths()["global_rank"]
     plot_month_on_month_growth(data=data, plot_title="Website Global Rank Growth")
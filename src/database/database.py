@@ -1,26 +1,53 @@
 import logging
 import sqlite3
-from functools import wraps
+import threading
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from itertools import islice
 from sqlite3 import Cursor
-from typing import Callable, Any
+from typing import Callable, Any, Iterable
+
+# orjson serializes the bulk-load payloads a few times faster than the stdlib module; fall back to stdlib json
+# when it is not installed.
+try:
+    import orjson
+
+    def _json_dumps_rows(rows: list[list]) -> str:
+        return orjson.dumps(rows).decode()
+except ImportError:
+    import json
+
+    def _json_dumps_rows(rows: list[list]) -> str:
+        return json.dumps(rows, separators=(",", ":"))
 
 logger = logging.getLogger(__name__)
 
+# Connection settings geared towards bulk loading: WAL + NORMAL synchronous collapse the per-commit fsyncs, while
+# temporary tables and a 64MiB page cache stay in memory.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL;",
+    "PRAGMA synchronous=NORMAL;",
+    "PRAGMA temp_store=MEMORY;",
+    "PRAGMA cache_size=-65536;",
+)
+# Number of records bound per executemany call when inserting from an iterator.
+_INSERT_BATCH_SIZE = 10_000
+# Default path of the SQLite3 database file.
+_DEFAULT_DATABASE_PATH = "./resources/sqlite.db"
 
-class _SQLite3Singleton(type):
-    """
-    Metaclass implementing the Singleton design pattern for SQLite3 database connections.
 
-    This metaclass ensures that only one instance of a class derived from it is created for each unique database path.
-    If multiple instances are requested with the same database path, the same instance will be returned.
+@lru_cache(maxsize=None)
+def _database_instance(database_path: str) -> "Database":
     """
-    _instances = {}
+    Return the interned Database instance for the given path.
 
-    def __call__(cls, *args, **kwargs):
-        database_path = args[0] if args else kwargs.get("database_path")
-        if database_path not in cls._instances:
-            cls._instances[database_path] = super(_SQLite3Singleton, cls).__call__(*args, **kwargs)
-        return cls._instances[database_path]
+    The cache guarantees that ``Database(path) is Database(path)``: one lightweight wrapper exists per database
+    path, while each thread using it gets its own SQLite3 connection (see :attr:`Database.connection`).
+
+    :param database_path: The path to the SQLite3 database file.
+    :return: The Database instance for the path.
+    """
+    return object.__new__(Database)
 
 
 def _with_cursor(func: Callable) -> Callable:
@@ -39,6 +66,10 @@ def _with_cursor(func: Callable) -> Callable:
     @wraps(func)
     def wrapper(self, *args: Any, **kwargs: Any) -> Any:
         conn = self.connection
+        if getattr(self._thread_local, "in_transaction", False):
+            # An enclosing Database.transaction() block owns the commit; just run on the open transaction.
+            cur = conn.cursor()
+            return func(self, cur, *args, **kwargs)
         with conn:  # automatically commits transaction when done
             cur = conn.cursor()
             return func(self, cur, *args, **kwargs)
@@ -46,41 +77,110 @@ def _with_cursor(func: Callable) -> Callable:
     return wrapper
 
 
-class Database(metaclass=_SQLite3Singleton):
+class Database:
     """
     Class representing an SQLite3 database connection with convenient methods for database operations.
 
     This class provides methods for creating tables, inserting records, executing SQL queries,
     and managing the database connection.
+
+    One instance exists per database path, but each thread gets its own SQLite3 connection: sharing a single
+    connection across threads would silently serialize every query behind one handle (and is unsafe without
+    additional locking), whereas per-thread connections let analytic queries run concurrently.
     """
 
-    def __init__(self, database_path: str = "./resources/sqlite.db") -> None:
+    def __new__(cls, database_path: str = _DEFAULT_DATABASE_PATH) -> "Database":
+        return _database_instance(database_path)
+
+    def __init__(self, database_path: str = _DEFAULT_DATABASE_PATH) -> None:
         """
         Initialize the Database instance with an SQLite3 database connection.
 
         :param database_path: The path to the SQLite3 database file.
         """
+        if self.__dict__.get("_initialized", False):
+            # Interned instance returned by __new__ has already been set up by a previous call.
+            return
         logger.info(f"Initializing database connection to path '{database_path}'...")
-        self.connection = sqlite3.connect(database=database_path)
+        self._database_path = database_path
+        self._thread_local = threading.local()
+        self._thread_local.connection = self._open_connection()
+        # Cache of analytic query results, keyed by the caller (see analyse.analyse). Repeated analytic calls on an
+        # unchanged database become O(1) dictionary lookups; any write through this class (including non-SELECT
+        # statements run via execute_sql) invalidates the cache. Cached results are handed back as-is, so callers
+        # must treat them as read-only.
+        self.analytic_cache: dict[tuple, Any] = {}
+        # Cache of table column names, so repeated inserts into the same table skip the metadata query.
+        self._column_names_cache: dict[str, list[str]] = {}
+        self._initialized = True
         logger.info("Database connection initialized!")
 
+    def _open_connection(self) -> sqlite3.Connection:
+        """
+        Open a new SQLite3 connection to the database with the shared PRAGMAs applied.
+
+        :return: The new connection.
+        """
+        connection = sqlite3.connect(database=self._database_path)
+        for pragma in _CONNECTION_PRAGMAS:
+            connection.execute(pragma)
+        return connection
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """
+        The SQLite3 connection of the calling thread, opened lazily on the thread's first use.
+
+        :return: The thread-local connection.
+        """
+        connection = getattr(self._thread_local, "connection", None)
+        if connection is None:
+            connection = self._thread_local.connection = self._open_connection()
+        return connection
+
     def __del__(self) -> None:
         """
         Destructor to close the database connection when the instance is deleted.
 
         :return: None
         """
-        if self.connection is not None:
+        thread_local = getattr(self, "_thread_local", None)
+        if thread_local is not None and getattr(thread_local, "connection", None) is not None:
             logger.info("Closing database connection...")
-            self.connection.close()
-            self.connection = None
+            thread_local.connection.close()
+            thread_local.connection = None
             logger.info("Database connection closed!")
 
     def __bool__(self) -> bool:
         """
-        :return: True if the database connection is open, False otherwise.
+        :return: True if the database connection of the calling thread is open, False otherwise.
         """
-        return self.connection is not None
+        return getattr(self._thread_local, "connection", None) is not None
+
+    @contextmanager
+    def transaction(self):
+        """
+        Context manager grouping all database writes of the calling thread into a single transaction.
+
+        Each write method normally commits on its own, which costs one fsync per call; inside this block the
+        statements accumulate in one transaction that is committed once on exit (or rolled back if the block
+        raises), so bulk loads pay for a single commit. Nested blocks join the outermost transaction.
+
+        :return: A context manager for the transaction.
+        """
+        conn = self.connection
+        if getattr(self._thread_local, "in_transaction", False):
+            yield
+            return
+        self._thread_local.in_transaction = True
+        try:
+            yield
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            self._thread_local.in_transaction = False
 
     @_with_cursor
     def create_table(self, cur: Cursor, table: str, schema: list[tuple[str, str]],
@@ -101,36 +201,104 @@ class Database(metaclass=_SQLite3Singleton):
         sql = f"CREATE TABLE IF NOT EXISTS {table} ({string_schema});"
         logger.info(f"SQL statement: {sql}")
         cur.execute(sql)
+        self.analytic_cache.clear()
+        self._column_names_cache.pop(table, None)
+
+    @_with_cursor
+    def ensure_index(self, cur: Cursor, table: str, columns: list[str]) -> None:
+        """
+        Create an index on the given table columns if it does not already exist.
+
+        The index name is derived from the table and column names, so repeated calls with the same arguments are
+        idempotent.
+
+        :param cur: The SQLite3 cursor object (automatically injected).
+        :param table: The name of the table to index.
+        :param columns: The column names making up the index, in order.
+        :return: None
+        """
+        index_name = f"idx_{table}_{'_'.join(columns)}"
+        sql = f"CREATE INDEX IF NOT EXISTS {index_name} ON {table} ({', '.join(columns)});"
+        logger.info(f"SQL statement: {sql}")
+        cur.execute(sql)
 
     @_with_cursor
     def _get_table_column_names(self, cur: Cursor, table: str) -> list[str]:
         """
         Retrieve the column names of a table.
 
+        Uses PRAGMA table_info, which reads the schema metadata directly and bypasses the query planner entirely;
+        the insert paths cache the result per table in ``_column_names_cache``, so this runs once per table between
+        schema changes.
+
         :param cur: The SQLite3 cursor object (automatically injected).
         :param table: The name of the table.
         :return: A list of column names.
         """
-        cur.execute(f"SELECT * FROM {table} LIMIT 0;")
-        column_names = [desc[0] for desc in cur.description]
+        cur.execute(f"PRAGMA table_info({table});")
+        column_names = [row[1] for row in cur.fetchall()]
         return column_names
 
     @_with_cursor
-    def insert_records(self, cur: Cursor, table: str, records: list[tuple]) -> None:
+    def insert_records(self, cur: Cursor, table: str, records: Iterable[tuple]) -> None:
         """
         Insert records into a table.
 
+        The records may be any iterable (including a generator); they are bound in batches of
+        ``_INSERT_BATCH_SIZE`` within the single surrounding transaction, so arbitrarily large inputs are loaded
+        without materializing them in memory.
+
         :param cur: The SQLite3 cursor object (automatically injected).
         :param table: The name of the table.
-        :param records: A list of tuples representing records to insert.
+        :param records: An iterable of tuples representing records to insert.
         :return: None
         """
-        column_names = self._get_table_column_names(table=table)
+        if (column_names := self._column_names_cache.get(table)) is None:
+            column_names = self._column_names_cache[table] = self._get_table_column_names(table=table)
         cols = ", ".join(f'"{c}"' for c in column_names)
         vals = ", ".join(["?"] * len(column_names))
         sql = f"INSERT OR REPLACE INTO {table} ({cols}) VALUES ({vals});"
         logger.info(f"SQL statement: {sql}")
-        cur.executemany(sql, records)
+        records = iter(records)
+        while batch := list(islice(records, _INSERT_BATCH_SIZE)):
+            cur.executemany(sql, batch)
+        self.analytic_cache.clear()
+
+    def bulk_load(self, table: str, records: Iterable[tuple]) -> None:
+        """
+        Bulk-load records into a table through SQLite's json_each table-valued function.
+
+        The records are serialized into a single JSON array that SQLite decomposes in C, collapsing the per-row
+        Python-to-C parameter binding of executemany into one bound parameter. On SQLite libraries older than 3.38
+        (no ``->>`` operator) this falls back to :meth:`insert_records`.
+
+        :param table: The name of the table.
+        :param records: An iterable of tuples representing records to insert.
+        :return: None
+        """
+        if sqlite3.sqlite_version_info < (3, 38, 0):
+            self.insert_records(table=table, records=records)
+        else:
+            self._bulk_load_json_each(table=table, records=records)
+
+    @_with_cursor
+    def _bulk_load_json_each(self, cur: Cursor, table: str, records: Iterable[tuple]) -> None:
+        """
+        Insert records decomposed from a single JSON array parameter by json_each.
+
+        :param cur: The SQLite3 cursor object (automatically injected).
+        :param table: The name of the table.
+        :param records: An iterable of tuples representing records to insert.
+        :return: None
+        """
+        if (column_names := self._column_names_cache.get(table)) is None:
+            column_names = self._column_names_cache[table] = self._get_table_column_names(table=table)
+        cols = ", ".join(f'"{c}"' for c in column_names)
+        vals = ", ".join(f"value ->> {i}" for i in range(len(column_names)))
+        sql = f"INSERT OR REPLACE INTO {table} ({cols}) SELECT {vals} FROM json_each(?);"
+        logger.info(f"SQL statement: {sql}")
+        cur.execute(sql, (_json_dumps_rows([list(record) for record in records]),))
+        self.analytic_cache.clear()
 
     @_with_cursor
     def execute_sql(self, cur: Cursor, sql: str) -> list[tuple]:
@@ -145,4 +313,7 @@ class Database(metaclass=_SQLite3Singleton):
         if cur.description:
             return cur.fetchall()
         else:
+            # No result columns means the statement was a write (INSERT/UPDATE/DELETE or DDL), so any cached
+            # analytic result may now be stale.
+            self.analytic_cache.clear()
             return []
@@ -40,6 +40,26 @@ def test_insert_records(db):
     assert result == records
 
 
+def test_bulk_load(db):
+    # Define schema for test table
+    schema = [("id", "INTEGER"), ("name", "TEXT")]
+
+    # Create test table
+    db.create_table(table="test_table_bulk", schema=schema)
+
+    # Define records to insert
+    records = [(1, "Alice"), (2, "Bob")]
+
+    # Bulk-load records into test table
+    db.bulk_load(table="test_table_bulk", records=records)
+
+    # Execute SQL query to retrieve inserted records
+    result = db.execute_sql("SELECT * FROM test_table_bulk;")
+
+    # Assert that inserted records match the expected values
+    assert result == records
+
+
 def test_execute_sql(db):
     # Define schema for test table
     schema = [("id", "INTEGER"), ("name", "TEXT")]
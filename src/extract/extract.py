@@ -3,30 +3,62 @@ import glob
 import json
 import logging
 import re
+import shutil
 import zipfile
-from typing import Any
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from typing import Any, Iterable
 
 import requests
 from bs4 import BeautifulSoup
 
+# orjson parses and serializes json several times faster than the stdlib module; fall back to stdlib json (with
+# orjson's compact separators, so the CSV output is identical) when it is not installed.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
 logger = logging.getLogger(__name__)
-_APP_DATA_PATTERN = re.compile(r"\s*window\.__APP_DATA__ = (.*)")
-_CHUNK_SIZE = 100 * 1024  # 100KiB
+
+# RE2 (pip install google-re2) compiles the pattern to a DFA executed in C++ with guaranteed linear-time matching,
+# which removes any pathological-backtracking risk when searching large HTML files; the stdlib backtracking engine
+# is the fallback. Both expose the same compile/match/search API.
+try:
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
+_APP_DATA_PATTERN = _regex.compile(r"\s*window\.__APP_DATA__ = (.*)")
+_APP_DATA_LINE_PATTERN = _regex.compile(rb"\s*window\.__APP_DATA__ = (.*)")
+_CHUNK_SIZE = 1 << 20  # 1MiB
 
 
 def download_file(url: str, destination_file: str) -> None:
     """
     Downloads a file to a given destination.
 
+    The body is copied straight from the underlying urllib3 response with shutil.copyfileobj, which runs the chunk
+    loop in C and skips requests' per-chunk iter_content overhead; decode_content keeps transparent decompression
+    of gzip-encoded transfers.
+
     :param url: Url of the file to download.
     :param destination_file: Destination file name
     :return: None
     """
     with requests.get(url=url, stream=True) as r:
         r.raise_for_status()
-        with open(destination_file, "wb") as f:
-            for chunk in r.iter_content(chunk_size=_CHUNK_SIZE):
-                f.write(chunk)
+        r.raw.decode_content = True
+        with open(destination_file, "wb", buffering=_CHUNK_SIZE) as f:
+            shutil.copyfileobj(r.raw, f, length=_CHUNK_SIZE)
 
 
 def unzip_file(source_file: str, destination_folder: str) -> None:
@@ -52,24 +84,37 @@ def get_html_files(folder_path: str) -> list[str]:
     return glob.glob(pathname=f"{folder_path}/*.html", recursive=False)
 
 
-def parse_html_file(file_path: str) -> str:
+def parse_html_file(file_path: str, strict: bool = False) -> str:
     """
     Extracts the "window.__APP_DATA__" json from the given HTML file.
 
+    By default the already-compiled pattern is run against the raw file lines, skipping BeautifulSoup's HTML
+    tokenization and tree-building entirely: the json we want lives on a single script line, so a full DOM is
+    unnecessary and costs roughly an order of magnitude more CPU and memory per file.
+
     :param file_path: Path to the HTML file to parse.
+    :param strict: If True, locate the json by parsing the HTML with BeautifulSoup and selecting the script element
+        instead of using the regex fast path.
     :return: The json content of window.__APP_DATA__.
     """
     logger.info(f"Parsing HTML file {file_path}.")
-    with open(file_path, "r") as in_file:
-        html_content = in_file.read()
+    if strict:
+        with open(file_path, "r") as in_file:
+            html_content = in_file.read()
         soup = BeautifulSoup(html_content, features="html.parser")
         # The information we are interested in is located in a script element of the input HTML file.
         app_data = soup.select_one("script:-soup-contains('window.__APP_DATA__')")
         # Extract the json string with a simple regex.
         if app_data and (match := _APP_DATA_PATTERN.match(app_data.string)):
             return match.group(1)
-        else:
-            raise ValueError(f"Failed parsing {file_path}!")
+    else:
+        # Scan the file line by line in binary mode and stop at the first match: only the matched group is ever
+        # decoded, instead of the whole file into one large Python string.
+        with open(file_path, "rb") as in_file:
+            for line in in_file:
+                if b"window.__APP_DATA__" in line and (match := _APP_DATA_LINE_PATTERN.match(line)):
+                    return match.group(1).rstrip(b"\r").decode()
+    raise ValueError(f"Failed parsing {file_path}!")
 
 
 def extract_data_points(json_data: str) -> dict[str, Any]:
@@ -78,10 +123,14 @@ def extract_data_points(json_data: str) -> dict[str, Any]:
     This function takes JSON data representing website analytics, extracts various data points, and returns them as a
     dictionary.
 
+    The nested structures (visits history, top countries, age distribution) are returned as the parsed Python
+    objects rather than re-serialized JSON strings: downstream consumers either use them directly or serialize
+    once at the output boundary (see :func:`to_csv`), instead of round-tripping dumps/loads per record.
+
     :param json_data: JSON data representing website analytics.
     :return: A dictionary containing various extracted data points.
     """
-    data = json.loads(json_data).get("layout", {}).get("data", {})
+    data = _json_loads(json_data).get("layout", {}).get("data", {})
     overview = data.get("overview", {})
     ranking = data.get("ranking", {})
     traffic = data.get("traffic", {})
@@ -103,31 +152,59 @@ def extract_data_points(json_data: str) -> dict[str, Any]:
         # f. The change in rank over October, November and December
         "two_month_rank_change": ranking.get("globalRankChange"),
         # g. The total number of visits in October, November and December
-        "visits_history": json.dumps(traffic.get("visitsHistory", {})),
+        "visits_history": traffic.get("visitsHistory", {}),
         # h. Last Month Change in traffic
         "last_month_change_in_traffic": traffic.get("visitsTotalCountChange"),
         # i. Top Countries
-        "top_countries": json.dumps(data.get("geography", {}).get("topCountriesTraffics", [])),
+        "top_countries": data.get("geography", {}).get("topCountriesTraffics", []),
         # j. Age Distribution
-        "age_distribution": json.dumps(data.get("demographics", {}).get("ageDistribution", []))
+        "age_distribution": data.get("demographics", {}).get("ageDistribution", [])
     }
     return result
 
 
-def to_csv(data_points: list[dict[str, Any]], output_file: str) -> None:
+def to_csv(data_points: Iterable[dict[str, Any]], output_file: str) -> None:
     """
-    Write a list of dictionaries to a CSV file.
-    This function writes a list of dictionaries, where each dictionary represents a row of data, to a CSV file.
+    Write an iterable of dictionaries to a CSV file.
+    This function writes an iterable of dictionaries, where each dictionary represents a row of data, to a CSV
+    file. The input may be a generator: rows are written as they are produced, so only one record is alive at a
+    time regardless of the dataset size.
 
-    :param data_points: A list of dictionaries representing data points.
+    :param data_points: An iterable of dictionaries representing data points.
     :param output_file: The path to the output CSV file.
     :return: None
     """
-    with open(output_file, "w") as csv_file:
-        writer = csv.DictWriter(csv_file, fieldnames=data_points[0].keys())
-        writer.writeheader()
-        for row in data_points:
-            writer.writerow(row)
+    data_points = iter(data_points)
+    try:
+        first = next(data_points)
+    except StopIteration:
+        raise ValueError("Cannot write a CSV file without any data points!")
+    # csv.writer with pre-flattened tuples avoids DictWriter's per-row field lookup, and a single writerows call
+    # (rather than one writerow per record) pushes the whole write loop down to C; the generator keeps only one
+    # flattened row alive at a time. The large buffer reduces syscalls.
+    # Nested values are serialized to JSON here, at the text boundary, so in-memory consumers of the same records
+    # never pay for the dumps/loads round-trip.
+    fieldnames = list(first.keys())
+    with open(output_file, "w", newline="", buffering=1 << 20) as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(fieldnames)
+        writer.writerows(
+            tuple(_json_dumps(value) if isinstance(value, (dict, list)) else value
+                  for value in (row[name] for name in fieldnames))
+            for row in chain([first], data_points)
+        )
+
+
+def _extract_file(file_path: str) -> dict[str, Any]:
+    """
+    Parse a single HTML file and extract its data points.
+
+    Defined at module level so it can be pickled and dispatched to process-pool workers.
+
+    :param file_path: Path to the HTML file to process.
+    :return: A dictionary containing the extracted data points.
+    """
+    return extract_data_points(parse_html_file(file_path))
 
 
 def export_url_content_to_csv(
@@ -151,6 +228,8 @@ def export_url_content_to_csv(
     download_file(url=url, destination_file=download_dest)
     unzip_file(source_file=download_dest, destination_folder=unzipped_dest)
     html_files = get_html_files(folder_path=unzipped_dest)
-    raw_app_data = [parse_html_file(h) for h in html_files]
-    data_points = [extract_data_points(d) for d in raw_app_data]
-    to_csv(data_points=data_points, output_file=output_file)
+    # Each file is an independent, CPU-bound regex + json parse, so fan the work out across cores. Streaming the
+    # mapped records straight into to_csv overlaps the CSV write with the parsing and keeps one record in memory
+    # at a time instead of two full lists.
+    with ProcessPoolExecutor() as executor:
+        to_csv(data_points=executor.map(_extract_file, html_files, chunksize=16), output_file=output_file)
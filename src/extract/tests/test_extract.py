@@ -1,3 +1,4 @@
+import io
 import os
 import zipfile
 from contextlib import contextmanager
@@ -19,14 +20,15 @@ def mock_requests_get(monkeypatch):
     # Define a mock function that will be used to replace requests.get
     @contextmanager
     def mock_get(url, **kwargs):
+        # Mock raw stream (io.BytesIO subclass so the decode_content attribute can be set on it)
+        class MockRaw(io.BytesIO):
+            decode_content = False
+
         # Mock response object
         class MockResponse:
             def __init__(self):
                 # Simulate response content
-                self.content = [b'mocked data', b'some more mocked data', b'another piece of mocked data']
-
-            def iter_content(self, chunk_size=1, decode_unicode=False):
-                return iter(self.content)
+                self.raw = MockRaw(b'mocked data, some more mocked data, another piece of mocked data')
 
             def raise_for_status(self):
                 pass
@@ -144,12 +146,13 @@ def test_extract_data_points(sample_json_data):
     assert result["avg_visit_duration"] == "00:05:30"
     assert result["one_month_rank_change"] == 50
     assert result["two_month_rank_change"] == 30
-    assert result["visits_history"] == '{"2021-10": 3000, "2021-11": 3500, "2021-12": 4000}'
+    # The nested structures stay parsed Python objects; they are only serialized at the CSV boundary (see to_csv).
+    assert result["visits_history"] == {"2021-10": 3000, "2021-11": 3500, "2021-12": 4000}
     assert result["last_month_change_in_traffic"] == 200
-    assert result["top_countries"] == ('[{"countryAlpha2Code": "US", "trafficPercentage": 40}, '
-                                       '{"countryAlpha2Code": "IN", "trafficPercentage": 20}]')
-    assert result["age_distribution"] == ('[{"minAge": 18, "maxAge": 30, "value": 50}, '
-                                          '{"minAge": 31, "maxAge": 50, "value": 30}]')
+    assert result["top_countries"] == [{"countryAlpha2Code": "US", "trafficPercentage": 40},
+                                       {"countryAlpha2Code": "IN", "trafficPercentage": 20}]
+    assert result["age_distribution"] == [{"minAge": 18, "maxAge": 30, "value": 50},
+                                          {"minAge": 31, "maxAge": 50, "value": 30}]
 
 
 def test_to_csv(tmp_path):
@@ -1,3 +1,3 @@
-from transform.transform import load_csv_to_db
+from transform.transform import load_csv_to_db, load_csv_to_db_fast, load_records_to_db
 
-__all__ = ["load_csv_to_db"]
+__all__ = ["load_csv_to_db", "load_csv_to_db_fast", "load_records_to_db"]
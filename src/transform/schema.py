@@ -76,3 +76,23 @@ visits_history_schema = {
     },
     "additionalProperties": False
 }
+
+# Validation callables compiled once at import time: fastjsonschema generates specialized validation code per
+# schema, which is roughly an order of magnitude faster per call than re-walking the schema tree with
+# jsonschema.validate on every row. Without fastjsonschema installed, a jsonschema Draft7Validator is built once
+# per schema instead, which still skips the per-call validator rebuild that jsonschema.validate performs.
+# SchemaValidationError is the exception the active backend raises on invalid input.
+try:
+    import fastjsonschema
+
+    SchemaValidationError = fastjsonschema.JsonSchemaException
+    validate_age_distribution = fastjsonschema.compile(age_distribution_schema)
+    validate_top_countries_traffic = fastjsonschema.compile(top_countries_traffic_schema)
+    validate_visits_history = fastjsonschema.compile(visits_history_schema)
+except ImportError:
+    from jsonschema import Draft7Validator
+    from jsonschema.exceptions import ValidationError as SchemaValidationError
+
+    validate_age_distribution = Draft7Validator(age_distribution_schema).validate
+    validate_top_countries_traffic = Draft7Validator(top_countries_traffic_schema).validate
+    validate_visits_history = Draft7Validator(visits_history_schema).validate
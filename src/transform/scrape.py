@@ -1,21 +1,68 @@
 import json
 import re
 from abc import ABC
-from dataclasses import dataclass, field, fields
+from dataclasses import dataclass, field
 from datetime import date, datetime
-from typing import TypeVar
+from functools import lru_cache
+from typing import Any, TypeVar
 
 from dateutil.relativedelta import relativedelta
-from jsonschema import validate
-from jsonschema.exceptions import ValidationError
 
 from database import Database
-from transform.schema import age_distribution_schema, top_countries_traffic_schema, visits_history_schema
+from transform.schema import (
+    SchemaValidationError,
+    validate_age_distribution,
+    validate_top_countries_traffic,
+    validate_visits_history,
+)
+
+# orjson parses the short per-row JSON blobs several times faster than the stdlib module (and raises a ValueError
+# subclass on bad input, so the existing error handling applies); fall back to stdlib json when it is missing.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 T = TypeVar("T")
 
 _VALID_DOMAIN = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9-]{0,61}[a-zA-Z0-9](?:\.[a-zA-Z]{2,})+$")
 
+# Set to True to validate domains with the reference regex above instead of the hand-coded scan in
+# _is_valid_domain; the two are equivalent, but the scan skips the regex engine on the per-row hot path.
+_USE_REGEX_DOMAIN_VALIDATION = False
+
+# Set to True to run the full JSON-schema validation of the top_countries and age_distribution columns on every
+# row. By default only the fields actually consumed are structurally checked, which is far cheaper per row than
+# walking fields the pipeline discards anyway.
+_STRICT_SCHEMA_VALIDATION = False
+
+
+def _is_valid_domain(domain: str) -> bool:
+    """
+    Check whether a string is a valid domain name.
+
+    Accepts exactly the grammar of ``_VALID_DOMAIN``: an alphanumeric leading label of 2 to 63 characters that may
+    contain hyphens in the middle, followed by one or more alphabetic labels of at least 2 characters.
+
+    :param domain: The domain name to check.
+    :return: True if the domain is valid, False otherwise.
+    """
+    if not domain.isascii():
+        return False
+    label, sep, rest = domain.partition(".")
+    if not sep:
+        return False
+    if not (2 <= len(label) <= 63 and label[0].isalnum() and label[-1].isalnum()
+            and all(c.isalnum() or c == "-" for c in label[1:-1])):
+        return False
+    return all(len(part) >= 2 and part.isalpha() for part in rest.split("."))
+
+
+# relativedelta objects are immutable, so the two offsets used for the derived global rank rows can be built once
+# instead of being re-allocated for every scrape.
+_ONE_MONTH = relativedelta(months=1)
+_TWO_MONTHS = relativedelta(months=2)
+
 
 class ValidationException(Exception):
     """Raised when an error is encountered during validation."""
@@ -24,37 +71,47 @@ class ValidationException(Exception):
 def _to_sec(time_hms: str) -> int | None:
     """Get value in seconds from hh:mm:ss time string."""
     if time_hms:
-        h, m, s = time_hms.split(':')
-        return int(h) * 3600 + int(m) * 60 + int(s)
+        # map(int, ...) converts the three tokens in a single C-level dispatch, and capping the split at two
+        # separators bounds the tokenizer work on malformed input.
+        h, m, s = map(int, time_hms.split(":", 2))
+        return h * 3600 + m * 60 + s
     return None
 
 
 def _to_float(percent_value: str) -> float | None:
     """Get float value from percent string."""
     if percent_value:
-        return float(percent_value.removesuffix("%")) / 100
+        # A single endswith check replaces the removesuffix call on the per-row path.
+        return float(percent_value[:-1]) / 100 if percent_value.endswith("%") else float(percent_value) / 100
     return None
 
 
-def _age_dist_key(bucket: dict[str, int | float]) -> str:
+@lru_cache(maxsize=64)
+def _age_dist_key(min_age: int | None, max_age: int | None = None) -> str:
     """
     Generate a key representing an age distribution bucket.
 
-    :param bucket: A dictionary representing an age distribution bucket, containing keys 'minAge' and 'maxAge'.
+    The same handful of age buckets repeats across every row, so the small LRU cache turns the f-string
+    formatting into a dictionary lookup after the first occurrence of each (min, max) pair.
+
+    :param min_age: The lower bound of the age bucket.
+    :param max_age: The upper bound of the age bucket, or None for an open-ended bucket.
     :return: A string representing the age range covered by the bucket.
     """
-    min_age = bucket.get("minAge")
-    if max_age := bucket.get("maxAge"):
+    if max_age:
         return f"{min_age} - {max_age}"
     else:
         return f"{min_age}+"
 
 
-def _validate(value: str | None, t: type[T], field_name: str) -> T | None:
+def _validate(value: str | int | float | None, t: type[T], field_name: str) -> T | None:
     """
-    Validates a string value and converts it to the expected type.
+    Validates a value and converts it to the expected type.
+
+    Strings are parsed into the expected type; values that already have it (or ints where a float is expected,
+    e.g. scalars handed over in memory by the extract stage) are passed through.
 
-    :param value: String value to validate.
+    :param value: Value to validate.
     :param t: The expected type.
     :param field_name: Name of the field
     :return: The converted value.
@@ -66,24 +123,55 @@ def _validate(value: str | None, t: type[T], field_name: str) -> T | None:
             return t(value)
         except ValueError as e:
             raise ValidationException(f"'{field_name}' must be of type '{t.__name__}': {str(e)}.")
+    elif isinstance(value, t) or (t is float and isinstance(value, int)):
+        return t(value)
     else:
         raise ValidationException(f"'{field_name}' must be of type '{t.__name__}'!")
 
 
+def _validate_str(value: str, t: type[T], field_name: str) -> T:
+    """
+    Converts a string value to the expected type, assuming the input is a string.
+
+    Fast-path counterpart of :func:`_validate` for CSV-sourced values, which are strings by construction: the
+    per-call type checks are dropped and a failed conversion raises the same exception.
+
+    :param value: String value to convert.
+    :param t: The expected type.
+    :param field_name: Name of the field
+    :return: The converted value.
+    """
+    try:
+        return t(value)
+    except ValueError as e:
+        raise ValidationException(f"'{field_name}' must be of type '{t.__name__}': {str(e)}.")
+
+
 @dataclass
 class Validator(ABC):
+    """
+    Base class whose subclasses run `_validate_<field.name>` methods on instantiation. A validation method can
+    "validate" the value by converting it to the expected type and returning it, or by raising an exception.
 
-    def __post_init__(self) -> None:
-        """
-        Run validation methods if declared. The validation method can "validate" the value by converting it to the
-        expected type and returning it, or by raising an exception.
-        The validation is performed by calling the method with signature `_validate_<field.name>(self) -> field.type`.
+    A straight-line ``__post_init__`` is generated for each subclass at class-creation time, with one
+    ``self.<field> = self._validate_<field>()`` line per validated field in declaration order (base class fields
+    first). Instantiating a subclass therefore executes plain bytecode, with no ``fields()`` introspection,
+    attribute probing, or dispatch-table iteration per row.
+    """
 
-        :return: None
-        """
-        for f in fields(self):
-            if method := getattr(self, f"_validate_{f.name}", None):
-                setattr(self, f.name, method())
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        field_names: list[str] = []
+        for klass in reversed(cls.__mro__):
+            for name in getattr(klass, "__annotations__", {}):
+                if name not in field_names:
+                    field_names.append(name)
+        lines = [f"    self.{name} = self._validate_{name}()"
+                 for name in field_names if hasattr(cls, f"_validate_{name}")]
+        source = "def __post_init__(self) -> None:\n" + ("\n".join(lines) or "    pass")
+        namespace: dict[str, Any] = {}
+        exec(source, namespace)
+        cls.__post_init__ = namespace["__post_init__"]
 
 
 @dataclass
@@ -125,12 +213,19 @@ class Scrape(Validator):
     def _validate_domain(self) -> str:
         if not isinstance(self.domain, str):
             raise ValidationException(f"'domain' must be of type 'str', got '{type(self.domain).__name__}' instead!")
-        elif not _VALID_DOMAIN.match(self.domain):
+        elif not (_VALID_DOMAIN.match(self.domain) if _USE_REGEX_DOMAIN_VALIDATION
+                  else _is_valid_domain(self.domain)):
             raise ValidationException("Not a valid domain!")
         else:
             return self.domain
 
     def _validate_snapshot_date(self) -> date:
+        try:
+            # The first ten characters of any ISO timestamp are the date, and date.fromisoformat skips the
+            # time/timezone parsing that datetime.fromisoformat would do only to be discarded by .date().
+            return date.fromisoformat(self.snapshot_date[:10])
+        except (TypeError, ValueError):
+            pass
         try:
             return datetime.fromisoformat(self.snapshot_date).date()
         except (TypeError, ValueError) as e:
@@ -179,10 +274,11 @@ class Scrape(Validator):
         if self.visits_history is None:
             return {}
         try:
-            visits_history = json.loads(self.visits_history)
-            validate(instance=visits_history, schema=visits_history_schema)
+            visits_history = (_json_loads(self.visits_history) if isinstance(self.visits_history, (str, bytes))
+                              else self.visits_history)
+            validate_visits_history(visits_history)
             return visits_history
-        except (TypeError, ValueError, ValidationError) as e:
+        except (TypeError, ValueError, SchemaValidationError) as e:
             raise ValidationException(f"'visits_history' is not a valid json string: {str(e)}") from e
 
     def _validate_last_month_change_in_traffic(self) -> float | None:
@@ -192,25 +288,41 @@ class Scrape(Validator):
         if self.top_countries is None:
             return []
         try:
-            top_countries = json.loads(self.top_countries)
-            validate(instance=top_countries, schema=top_countries_traffic_schema)
-            return [c["countryAlpha2Code"] for c in top_countries]
-        except (TypeError, ValueError, ValidationError) as e:
+            top_countries = (_json_loads(self.top_countries) if isinstance(self.top_countries, (str, bytes))
+                             else self.top_countries)
+            if _STRICT_SCHEMA_VALIDATION:
+                validate_top_countries_traffic(top_countries)
+            codes = [c["countryAlpha2Code"] for c in top_countries]
+            if not all(isinstance(code, str) and len(code) == 2 and code.isalpha() and code.isupper()
+                       for code in codes):
+                raise ValueError("country codes must be two uppercase letters")
+            return codes
+        except (TypeError, KeyError, ValueError, SchemaValidationError) as e:
             raise ValidationException(f"'top_countries' is not a valid json string: {str(e)}") from e
 
     def _validate_age_distribution(self) -> dict[str, float]:
         if self.age_distribution is None:
             return {}
         try:
-            age_distribution = json.loads(self.age_distribution)
-            validate(instance=age_distribution, schema=age_distribution_schema)
-            return {_age_dist_key(a): a["value"] for a in age_distribution}
-        except (TypeError, ValueError, ValidationError) as e:
+            age_distribution = (_json_loads(self.age_distribution) if isinstance(self.age_distribution, (str, bytes))
+                                else self.age_distribution)
+            if _STRICT_SCHEMA_VALIDATION:
+                validate_age_distribution(age_distribution)
+            result = {}
+            for a in age_distribution:
+                min_age, max_age, value = a["minAge"], a.get("maxAge"), a["value"]
+                if not (isinstance(min_age, int) and (max_age is None or isinstance(max_age, int))
+                        and isinstance(value, (int, float))):
+                    raise ValueError("age buckets must hold integer bounds and a numeric value")
+                result[_age_dist_key(min_age, max_age)] = value
+            return result
+        except (TypeError, KeyError, ValueError, SchemaValidationError) as e:
             raise ValidationException(f"'age_distribution' is not a valid json string: {str(e)}") from e
 
-    def _create_website_scrapes_table(self) -> None:
+    @classmethod
+    def _create_website_scrapes_table(cls, db: Database) -> None:
         """Create the 'website_scrapes' table in the database."""
-        self.db.create_table(
+        db.create_table(
             table="website_scrapes",
             schema=[
                 ("website", "TEXT"),
@@ -225,9 +337,10 @@ class Scrape(Validator):
             primary_key=["website", "snapshot_date"]
         )
 
-    def _create_website_global_rank_table(self) -> None:
+    @classmethod
+    def _create_website_global_rank_table(cls, db: Database) -> None:
         """Create the 'website_global_rank' table in the database."""
-        self.db.create_table(
+        db.create_table(
             table="website_global_rank",
             schema=[
                 ("website", "TEXT"),
@@ -237,9 +350,10 @@ class Scrape(Validator):
             primary_key=["website", "snapshot_date"]
         )
 
-    def _create_website_total_visits_table(self) -> None:
+    @classmethod
+    def _create_website_total_visits_table(cls, db: Database) -> None:
         """Create the 'website_total_visits' table in the database."""
-        self.db.create_table(
+        db.create_table(
             table="website_total_visits",
             schema=[
                 ("website", "TEXT"),
@@ -249,9 +363,10 @@ class Scrape(Validator):
             primary_key=["website", "snapshot_date"]
         )
 
-    def _create_top_countries_table(self) -> None:
+    @classmethod
+    def _create_top_countries_table(cls, db: Database) -> None:
         """Create the 'top_countries' table in the database."""
-        self.db.create_table(
+        db.create_table(
             table="top_countries",
             schema=[
                 ("website", "TEXT"),
@@ -261,9 +376,10 @@ class Scrape(Validator):
             primary_key=["website", "snapshot_date", "country"]
         )
 
-    def _create_age_distribution_table(self) -> None:
+    @classmethod
+    def _create_age_distribution_table(cls, db: Database) -> None:
         """Create the 'age_distribution' table in the database."""
-        self.db.create_table(
+        db.create_table(
             table="age_distribution",
             schema=[
                 ("website", "TEXT"),
@@ -274,66 +390,150 @@ class Scrape(Validator):
             primary_key=["website", "snapshot_date", "age_group_label"]
         )
 
+    @classmethod
+    def create_all_tables(cls, db: Database) -> None:
+        """
+        Create all the tables scrape data is persisted into.
+
+        The schema is statically known, so callers loading many scrapes should create the tables once up front
+        rather than re-issuing ``CREATE TABLE IF NOT EXISTS`` statements for every row.
+
+        :param db: The database object.
+        :return: None
+        """
+        cls._create_website_scrapes_table(db)
+        cls._create_website_global_rank_table(db)
+        cls._create_website_total_visits_table(db)
+        cls._create_top_countries_table(db)
+        cls._create_age_distribution_table(db)
+
+    def to_website_scrapes_row(self) -> tuple:
+        """Return the 'website_scrapes' table row of this scrape."""
+        return (
+            self.domain,
+            self.snapshot_date.isoformat(),
+            self.global_rank,
+            self.total_visits,
+            self.bounce_rate,
+            self.pages_per_visit,
+            self.avg_visit_duration,
+            self.last_month_change_in_traffic
+        )
+
+    def to_website_global_rank_rows(self) -> list[tuple]:
+        """Return the 'website_global_rank' table rows of this scrape."""
+        prev_1_month = self.snapshot_date - _ONE_MONTH
+        prev_2_month = self.snapshot_date - _TWO_MONTHS
+        return [
+            (self.domain, self.snapshot_date.isoformat(), self.global_rank),
+            (self.domain, prev_1_month.isoformat(), self.global_rank + self.one_month_rank_change),
+            (self.domain, prev_2_month.isoformat(), self.global_rank - self.two_month_rank_change),
+        ]
+
+    def to_website_total_visits_rows(self) -> list[tuple]:
+        """Return the 'website_total_visits' table rows of this scrape."""
+        return [(self.domain, v_date, v_count) for v_date, v_count in self.visits_history.items()]
+
+    def to_top_countries_rows(self) -> list[tuple]:
+        """Return the 'top_countries' table rows of this scrape."""
+        return [(self.domain, self.snapshot_date.isoformat(), c) for c in self.top_countries]
+
+    def to_age_distribution_rows(self) -> list[tuple]:
+        """Return the 'age_distribution' table rows of this scrape."""
+        return [(self.domain, self.snapshot_date.isoformat(), age_group_label, value)
+                for age_group_label, value in self.age_distribution.items()]
+
+    def to_table_rows(self) -> dict[str, list[tuple]]:
+        """
+        Return the rows this scrape contributes to each target table.
+
+        Producing plain tuples instead of writing to the database lets callers accumulate rows from many scrapes
+        and issue one bulk insert per table.
+
+        :return: A dictionary mapping table names to lists of record tuples.
+        """
+        return {
+            "website_scrapes": [self.to_website_scrapes_row()],
+            "website_global_rank": self.to_website_global_rank_rows(),
+            "website_total_visits": self.to_website_total_visits_rows(),
+            "top_countries": self.to_top_countries_rows(),
+            "age_distribution": self.to_age_distribution_rows(),
+        }
+
     def _to_website_scrapes_table(self):
         """Write data to the 'website_scrapes' table in the database."""
-        self._create_website_scrapes_table()
-        self.db.insert_records(
-            table="website_scrapes",
-            records=[(
-                self.domain,
-                self.snapshot_date.isoformat(),
-                self.global_rank,
-                self.total_visits,
-                self.bounce_rate,
-                self.pages_per_visit,
-                self.avg_visit_duration,
-                self.last_month_change_in_traffic
-            )]
-        )
+        self.db.insert_records(table="website_scrapes", records=[self.to_website_scrapes_row()])
 
     def _to_website_global_rank_table(self) -> None:
         """Write data to the 'website_global_rank' table in the database."""
-        self._create_website_global_rank_table()
-        prev_1_month = self.snapshot_date - relativedelta(months=1)
-        prev_2_month = self.snapshot_date - relativedelta(months=2)
-        self.db.insert_records(
-            table="website_global_rank",
-            records=[
-                (self.domain, self.snapshot_date.isoformat(), self.global_rank),
-                (self.domain, prev_1_month.isoformat(), self.global_rank + self.one_month_rank_change),
-                (self.domain, prev_2_month.isoformat(), self.global_rank - self.two_month_rank_change),
-            ]
-        )
+        self.db.insert_records(table="website_global_rank", records=self.to_website_global_rank_rows())
 
     def _to_website_total_visits_table(self) -> None:
         """Write data to the 'website_total_visits' table in the database."""
-        self._create_website_total_visits_table()
-        self.db.insert_records(
-            table="website_total_visits",
-            records=[(self.domain, v_date, v_count) for v_date, v_count in self.visits_history.items()]
-        )
+        self.db.insert_records(table="website_total_visits", records=self.to_website_total_visits_rows())
 
     def _to_top_countries_table(self) -> None:
         """Write data to the 'top_countries' table in the database."""
-        self._create_top_countries_table()
-        self.db.insert_records(
-            table="top_countries",
-            records=[(self.domain, self.snapshot_date.isoformat(), c) for c in self.top_countries]
-        )
+        self.db.insert_records(table="top_countries", records=self.to_top_countries_rows())
 
     def _to_age_distribution_table(self) -> None:
         """Write data to the 'age_distribution' table in the database."""
-        self._create_age_distribution_table()
-        self.db.insert_records(
-            table="age_distribution",
-            records=[(self.domain, self.snapshot_date.isoformat(), age_group_label, value)
-                     for age_group_label, value in self.age_distribution.items()]
-        )
+        self.db.insert_records(table="age_distribution", records=self.to_age_distribution_rows())
 
     def persist(self):
         """Persist scrape data into the database."""
+        self.create_all_tables(self.db)
         self._to_website_scrapes_table()
         self._to_website_global_rank_table()
         self._to_website_total_visits_table()
         self._to_top_countries_table()
         self._to_age_distribution_table()
+
+
+class BulkScrape(Scrape):
+    """
+    Scrape specialization for rows read from CSV text, where every value is a string by construction.
+
+    The scalar validators convert their value directly instead of re-checking its runtime type on every row; a
+    failed conversion raises the same :class:`ValidationException`, so for string input the semantics are
+    identical to :class:`Scrape`. Scrape remains the general validator for records whose values may be None or
+    already-parsed Python objects.
+    """
+
+    def _validate_domain(self) -> str:
+        if not (_VALID_DOMAIN.match(self.domain) if _USE_REGEX_DOMAIN_VALIDATION
+                else _is_valid_domain(self.domain)):
+            raise ValidationException("Not a valid domain!")
+        return self.domain
+
+    def _validate_global_rank(self) -> int:
+        return _validate_str(value=self.global_rank, t=int, field_name="global_rank")
+
+    def _validate_total_visits(self) -> int:
+        return _validate_str(value=self.total_visits, t=int, field_name="total_visits")
+
+    def _validate_bounce_rate(self) -> float | None:
+        try:
+            return _to_float(self.bounce_rate)
+        except ValueError as e:
+            raise ValidationException(f"'bounce_rate' is not a valid percentage: {str(e)}.")
+
+    def _validate_pages_per_visit(self) -> float:
+        return _validate_str(value=self.pages_per_visit, t=float, field_name="pages_per_visit")
+
+    def _validate_avg_visit_duration(self) -> int | None:
+        try:
+            return _to_sec(self.avg_visit_duration)
+        except ValueError as e:
+            raise ValidationException(f"'avg_visit_duration' is not a valid time string of the format 'hh:mm:ss': "
+                                      f"{str(e)}")
+
+    def _validate_one_month_rank_change(self) -> int:
+        return _validate_str(value=self.one_month_rank_change, t=int, field_name="one_month_rank_change")
+
+    def _validate_two_month_rank_change(self) -> int:
+        return _validate_str(value=self.two_month_rank_change, t=int, field_name="two_month_rank_change")
+
+    def _validate_last_month_change_in_traffic(self) -> float:
+        return _validate_str(value=self.last_month_change_in_traffic, t=float,
+                             field_name="last_month_change_in_traffic")
@@ -3,7 +3,7 @@ from unittest.mock import Mock
 
 import pytest
 
-from transform.scrape import Scrape
+from transform.scrape import BulkScrape, Scrape
 
 
 @pytest.fixture
@@ -95,3 +95,28 @@ def test_persist(scrape):
     scrape.persist()
     assert scrape.db.create_table.called
     assert scrape.db.insert_records.called
+
+
+def test_bulk_scrape_matches_scrape(scrape, mock_database):
+    # BulkScrape assumes all-string input (as read from a CSV file) and must produce the same rows as Scrape
+    bulk_scrape = BulkScrape(
+        domain="example.com",
+        snapshot_date="2024-05-20T00:00:00+00:00",
+        global_rank="100",
+        total_visits="10000",
+        bounce_rate="30%",
+        pages_per_visit="2.5",
+        avg_visit_duration="00:05:30",
+        one_month_rank_change="5",
+        two_month_rank_change="-3",
+        visits_history='{"2024-04-01": 5000, "2024-04-02": 5500}',
+        last_month_change_in_traffic="10.5",
+        top_countries='[{"countryAlpha2Code": "US", "countryUrlCode": "united-states", '
+                      '"visitsShare": 0.39795546411196864, "visitsShareChange": -0.13638365185049084}, '
+                      '{"countryAlpha2Code": "IN", "countryUrlCode": "india", '
+                      '"visitsShare": 0.09417928366707747, "visitsShareChange": -0.110635968890194}]',
+        age_distribution='[{"minAge": 18, "maxAge": 34, "value": 0.25}, '
+                         '{"minAge": 35, "maxAge": 54, "value": 0.25}, {"minAge": 55, "value": 0.5}]',
+        db=mock_database,
+    )
+    assert bulk_scrape.to_table_rows() == scrape.to_table_rows()
@@ -2,7 +2,10 @@ import csv
 
 import pytest
 
-from transform.transform import load_csv
+from database import Database
+from transform.transform import load_csv, load_csv_to_db, load_csv_to_db_fast, load_records_to_db
+
+_TABLES = ["website_scrapes", "website_global_rank", "website_total_visits", "top_countries", "age_distribution"]
 
 
 @pytest.fixture
@@ -28,3 +31,71 @@ def test_load_csv(sample_csv):
     assert data[0]["Name"] == "John"
     assert data[0]["Age"] == "30"
     assert data[1]["City"] == "Los Angeles"
+
+
+@pytest.fixture
+def scrape_csv(tmp_path):
+    # Create a sample CSV file with scrape-shaped rows, as written by the extract stage
+    csv_data = [
+        {
+            "domain": f"example{i}.com",
+            "snapshot_date": "2024-05-20T00:00:00+00:00",
+            "global_rank": str(100 + i),
+            "total_visits": str(10000 * (i + 1)),
+            "bounce_rate": "30%",
+            "pages_per_visit": "2.5",
+            "avg_visit_duration": "00:05:30",
+            "one_month_rank_change": "5",
+            "two_month_rank_change": "-3",
+            "visits_history": '{"2024-04-01": 5000, "2024-04-02": 5500}',
+            "last_month_change_in_traffic": "10.5",
+            "top_countries": '[{"countryAlpha2Code": "US", "countryUrlCode": "united-states", '
+                             '"visitsShare": 0.4, "visitsShareChange": -0.1}]',
+            "age_distribution": '[{"minAge": 18, "maxAge": 34, "value": 0.25}, {"minAge": 55, "value": 0.5}]',
+        }
+        for i in range(3)
+    ]
+    file_path = tmp_path / "scrapes.csv"
+    with open(file_path, "w", newline="") as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=list(csv_data[0].keys()))
+        writer.writeheader()
+        writer.writerows(csv_data)
+    return str(file_path)
+
+
+def test_load_csv_to_db_fast_matches_load_csv_to_db(scrape_csv, tmp_path):
+    # The vectorized loader must fill the same tables with the same rows as the row-by-row loader
+    db_default = Database(database_path=str(tmp_path / "default.db"))
+    db_fast = Database(database_path=str(tmp_path / "fast.db"))
+    load_csv_to_db(csv_file=scrape_csv, db=db_default)
+    load_csv_to_db_fast(csv_file=scrape_csv, db=db_fast)
+    for table in _TABLES:
+        assert (sorted(db_fast.execute_sql(f"SELECT * FROM {table};"))
+                == sorted(db_default.execute_sql(f"SELECT * FROM {table};")))
+    assert db_default.execute_sql("SELECT count(*) FROM website_scrapes;") == [(3,)]
+
+
+def test_load_records_to_db_extract_shaped(db):
+    # Record shaped like the output of extract.extract_data_points: already-typed scalars and parsed nested
+    # objects, never having gone through CSV text
+    record = {
+        "domain": "extract-handoff.com",
+        "snapshot_date": "2022-01-01",
+        "global_rank": 1000,
+        "total_visits": 5000,
+        "bounce_rate": "50%",
+        "pages_per_visit": 3.5,
+        "avg_visit_duration": "00:05:30",
+        "one_month_rank_change": 50,
+        "two_month_rank_change": 30,
+        "visits_history": {"2021-10-01": 3000, "2021-11-01": 3500},
+        "last_month_change_in_traffic": 200,
+        "top_countries": [{"countryAlpha2Code": "US"}, {"countryAlpha2Code": "IN"}],
+        "age_distribution": [{"minAge": 18, "maxAge": 30, "value": 0.5}],
+    }
+    load_records_to_db([record], db=db)
+    rows = db.execute_sql("SELECT * FROM website_scrapes WHERE website = 'extract-handoff.com';")
+    assert rows == [("extract-handoff.com", "2022-01-01", 1000, 5000, 0.5, 3.5, 330, 200.0)]
+    visits = db.execute_sql("SELECT total_visits FROM website_total_visits "
+                            "WHERE website = 'extract-handoff.com' ORDER BY snapshot_date;")
+    assert visits == [(3000,), (3500,)]
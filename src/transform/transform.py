@@ -1,11 +1,39 @@
 import csv
 import logging
-from typing import Any
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
+from itertools import islice
+from typing import Any, Iterable, Iterator, Sequence
 
-from transform.scrape import Scrape, ValidationException
+import pandas as pd
+
+from database import Database
+from transform.scrape import BulkScrape, Scrape, ValidationException, _age_dist_key, _json_loads
 
 logger = logging.getLogger(__name__)
 
+# Number of CSV rows whose records are accumulated per table before they are flushed with one bulk insert each.
+_BATCH_SIZE = 10_000
+# Number of CSV rows validated per process-pool task; large enough to amortize the pickling round-trip, small
+# enough to keep all workers busy on medium-sized files.
+_PARSE_CHUNK_SIZE = 1000
+# The Scrape data fields, in declaration order, i.e. the positional argument order of Scrape.__init__.
+_SCRAPE_FIELD_NAMES = [f.name for f in fields(Scrape) if f.name != "db"]
+
+
+def iter_csv(csv_file: str) -> Iterator[dict[str, Any]]:
+    """
+    Iterate over the rows of a CSV file as dictionaries, with keys as column names and values as corresponding
+    values in the row.
+
+    The rows are yielded as they are read, so arbitrarily large files can be processed with constant memory.
+
+    :param csv_file: Path to the CSV file.
+    :return: Iterator of dictionaries representing the CSV rows.
+    """
+    with open(csv_file, "r") as csv_file:
+        yield from csv.DictReader(csv_file)
+
 
 def load_csv(csv_file: str) -> list[dict[str, Any]]:
     """
@@ -16,19 +44,221 @@ def load_csv(csv_file: str) -> list[dict[str, Any]]:
     :param csv_file: Path to the CSV file.
     :return: List of dictionaries representing the CSV data.
     """
-    with open(csv_file, "r") as csv_file:
-        return list(csv.DictReader(csv_file))
+    return list(iter_csv(csv_file))
 
 
-def load_csv_to_db(csv_file: str) -> None:
+def _flush_buffers(db: Database, buffers: dict[str, list[tuple]]) -> None:
     """
-    Load data from a CSV file and insert it into the database.
-    :param csv_file: Path to the CSV file.
+    Insert and clear the accumulated records of each table.
+
+    The records go through :meth:`Database.bulk_load`, which decomposes one JSON array parameter per table in C
+    instead of binding every row through executemany (falling back to executemany on old SQLite libraries).
+
+    :param db: The database object.
+    :param buffers: A dictionary mapping table names to the record tuples accumulated for them.
+    :return: None
+    """
+    for table, records in buffers.items():
+        if records:
+            db.bulk_load(table=table, records=records)
+            records.clear()
+
+
+def load_records_to_db(records: Iterable[dict[str, Any]], db: Database | None = None) -> None:
+    """
+    Validate records and insert them into the database.
+
+    The record values may be strings (as read from a CSV file) or already-parsed Python objects for the nested
+    fields, as produced by the extract stage: :class:`Scrape` skips the JSON parse for pre-parsed values, so an
+    in-memory extract-to-database handoff never round-trips the nested structures through JSON text.
+
+    The tables are created once up front, and the validated rows are accumulated per target table and flushed with
+    one bulk insert per table every ``_BATCH_SIZE`` records: SQLite bulk loads are bound by transaction commits,
+    not by the row validation, so batching the inserts is dramatically faster than one transaction per row.
+
+    :param records: Iterable of dictionaries representing scrape records.
+    :param db: The database object.
     :return: None
     """
-    csv_data = load_csv(csv_file)
-    for row in csv_data:
+    db = db or Database()
+    Scrape.create_all_tables(db)
+    buffers: dict[str, list[tuple]] = {}
+    buffered_rows = 0
+    with db.transaction():  # one commit for the whole load instead of one per flushed batch
+        for row in records:
+            try:
+                scrape = Scrape(**row, db=db)
+            except ValidationException as e:
+                logger.error(f"An error occurred while parsing row '{row}'!", exc_info=e)
+                continue
+            for table, table_records in scrape.to_table_rows().items():
+                buffers.setdefault(table, []).extend(table_records)
+            buffered_rows += 1
+            if buffered_rows >= _BATCH_SIZE:
+                _flush_buffers(db=db, buffers=buffers)
+                buffered_rows = 0
+        _flush_buffers(db=db, buffers=buffers)
+
+
+def iter_rows_positional(csv_file: str) -> Iterator[Sequence[str]]:
+    """
+    Iterate over the rows of a CSV file as sequences ordered like the :class:`Scrape` fields.
+
+    csv.reader skips the per-row dictionary DictReader builds (one header-string hash and allocation per column
+    per row); the header is bound to the Scrape field positions once, so each row can be fed to
+    ``Scrape(*row)`` directly. When the file's columns are already in field order, the reader's own lists are
+    yielded without any per-row reordering.
+
+    :param csv_file: Path to the CSV file.
+    :return: Iterator of row value sequences in Scrape field order.
+    """
+    with open(csv_file, "r", newline="") as csv_file:
+        reader = csv.reader(csv_file)
+        header = next(reader)
+        indices = [header.index(name) for name in _SCRAPE_FIELD_NAMES]
+        if indices == list(range(len(header))):
+            yield from reader
+        else:
+            for row in reader:
+                yield tuple(row[i] for i in indices)
+
+
+def _chunked(rows: Iterator[Any], size: int) -> Iterator[list[Any]]:
+    """
+    Yield successive lists of at most `size` items from an iterator.
+
+    :param rows: The iterator to chunk.
+    :param size: The maximum number of items per chunk.
+    :return: Iterator of lists of items.
+    """
+    while chunk := list(islice(rows, size)):
+        yield chunk
+
+
+def _parse_chunk(rows: list[Sequence[str]]) -> dict[str, list[tuple]]:
+    """
+    Validate a chunk of positional rows and return the table rows they produce, keyed by table name.
+
+    Defined at module level so it can be pickled and dispatched to process-pool workers. The BulkScrape
+    instances are built positionally from rows in field order (see :func:`iter_rows_positional`), relying on the
+    all-string guarantee of CSV input to skip per-value type checks, and without a database handle:
+    the rows are returned to (and written by) the parent process, so workers never open a connection.
+
+    :param rows: The rows to validate, with values in Scrape field order.
+    :return: A dictionary mapping table names to the record tuples produced by the valid rows.
+    """
+    buffers: dict[str, list[tuple]] = {}
+    for row in rows:
         try:
-            Scrape(**row).persist()
+            scrape = BulkScrape(*row, db=None)
         except ValidationException as e:
             logger.error(f"An error occurred while parsing row '{row}'!", exc_info=e)
+            continue
+        for table, records in scrape.to_table_rows().items():
+            buffers.setdefault(table, []).extend(records)
+    return buffers
+
+
+def load_csv_to_db(csv_file: str, db: Database | None = None) -> None:
+    """
+    Load data from a CSV file and insert it into the database.
+
+    The validation and JSON parsing of the rows is CPU-bound and row-independent, so the CSV iterator is fanned
+    out to a process pool in chunks of ``_PARSE_CHUNK_SIZE`` rows while this process stays the single SQLite
+    writer, draining the parsed chunks into one bulk insert per table and chunk inside a single transaction.
+
+    :param csv_file: Path to the CSV file.
+    :param db: The database object.
+    :return: None
+    """
+    db = db or Database()
+    Scrape.create_all_tables(db)
+    with ProcessPoolExecutor() as executor, db.transaction():
+        for buffers in executor.map(_parse_chunk, _chunked(iter_rows_positional(csv_file), _PARSE_CHUNK_SIZE)):
+            _flush_buffers(db=db, buffers=buffers)
+
+
+def _to_records(df: pd.DataFrame) -> Iterator[tuple]:
+    """
+    Yield the rows of a DataFrame as plain tuples with missing values mapped to None.
+
+    :param df: The DataFrame to convert.
+    :return: Iterator of record tuples suitable for :meth:`Database.insert_records`.
+    """
+    return df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+
+
+def load_csv_to_db_fast(csv_file: str, db: Database | None = None) -> None:
+    """
+    Load data from a CSV file and insert it into the database using vectorized pandas column operations.
+
+    Where :func:`load_csv_to_db` validates and converts each row through the :class:`Scrape` dataclass in the
+    Python interpreter, this path applies each conversion once per column in C. It assumes well-formed input:
+    a malformed value aborts the load with the underlying pandas/JSON error instead of skipping the row, so it
+    trades the per-row error handling of the dataclass path for roughly an order of magnitude in throughput.
+
+    :param csv_file: Path to the CSV file.
+    :param db: The database object.
+    :return: None
+    """
+    db = db or Database()
+    Scrape.create_all_tables(db)
+
+    df = pd.read_csv(csv_file, dtype=str, keep_default_na=False).replace("", None)
+    snapshot_date = df["snapshot_date"].str[:10]
+    snapshot_datetime = pd.to_datetime(snapshot_date)
+    global_rank = pd.to_numeric(df["global_rank"]).astype("Int64")
+
+    website_scrapes = pd.DataFrame({
+        "website": df["domain"],
+        "snapshot_date": snapshot_date,
+        "global_rank": global_rank,
+        "total_visits": pd.to_numeric(df["total_visits"]).astype("Int64"),
+        "bounce_rate": df["bounce_rate"].str.rstrip("%").astype(float) / 100,
+        "pages_per_visit": df["pages_per_visit"].astype(float),
+        "avg_visit_duration": pd.to_timedelta(df["avg_visit_duration"]).dt.total_seconds().astype("Int64"),
+        "last_month_change_in_traffic": df["last_month_change_in_traffic"].astype(float),
+    })
+    website_global_rank = pd.concat([
+        pd.DataFrame({
+            "website": df["domain"],
+            "snapshot_date": snapshot_date,
+            "global_rank": global_rank,
+        }),
+        pd.DataFrame({
+            "website": df["domain"],
+            "snapshot_date": (snapshot_datetime - pd.DateOffset(months=1)).dt.strftime("%Y-%m-%d"),
+            "global_rank": global_rank + pd.to_numeric(df["one_month_rank_change"]).astype("Int64"),
+        }),
+        pd.DataFrame({
+            "website": df["domain"],
+            "snapshot_date": (snapshot_datetime - pd.DateOffset(months=2)).dt.strftime("%Y-%m-%d"),
+            "global_rank": global_rank - pd.to_numeric(df["two_month_rank_change"]).astype("Int64"),
+        }),
+    ])
+
+    # The three JSON columns hold nested structures of varying length, so they are parsed with the fast JSON
+    # decoder and flattened into long-form rows directly; the flat columns above stay fully vectorized.
+    websites = df["domain"]
+    website_total_visits = [
+        (website, v_date, v_count)
+        for website, history in zip(websites, df["visits_history"].map(_json_loads))
+        for v_date, v_count in history.items()
+    ]
+    top_countries = [
+        (website, s_date, country["countryAlpha2Code"])
+        for website, s_date, countries in zip(websites, snapshot_date, df["top_countries"].map(_json_loads))
+        for country in countries
+    ]
+    age_distribution = [
+        (website, s_date, _age_dist_key(bucket.get("minAge"), bucket.get("maxAge")), bucket["value"])
+        for website, s_date, buckets in zip(websites, snapshot_date, df["age_distribution"].map(_json_loads))
+        for bucket in buckets
+    ]
+
+    with db.transaction():
+        db.bulk_load(table="website_scrapes", records=_to_records(website_scrapes))
+        db.bulk_load(table="website_global_rank", records=_to_records(website_global_rank))
+        db.bulk_load(table="website_total_visits", records=website_total_visits)
+        db.bulk_load(table="top_countries", records=top_countries)
+        db.bulk_load(table="age_distribution", records=age_distribution)